@@ -10,18 +10,78 @@ Component: 1 - Web Search MCP Server (Primary Priority)
 
 import os
 import json
+import time
+import copy
 import asyncio
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
 from pathlib import Path
+import aiohttp
 import httpx
+import orjson
 import re
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, urlsplit, urlunsplit, parse_qsl, urlencode
 
+from httpx_aiohttp import AiohttpTransport
 from mcp.server.fastmcp import FastMCP
 
 
+# Strips inline markup from provider snippets
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Search results are cached for minutes, fresh enough for a research session
+CACHE_TTL = 600.0  # seconds
+CACHE_MAX_SIZE = 1024
+
+# Connection pool and timeouts shared by all requests of a provider's long-lived HTTP client
+HTTP_LIMITS = httpx.Limits(
+    max_connections=50, max_keepalive_connections=20, keepalive_expiry=60)
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchResult:
+    """A single search result returned by a provider."""
+    title: str
+    url: str
+    snippet: str
+    source: str
+
+
+def _normalize_url(url: str) -> str:
+    """Normalize a URL for duplicate detection (case, trailing slash, tracking params)."""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        # Malformed netloc (e.g. an unclosed IPv6 bracket); dedupe on the raw URL
+        return url
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith('utm_') and key != 'fbclid'
+    ])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(),
+                       parts.path.rstrip('/'), query, parts.fragment))
+
+
+def _parse_json(response: httpx.Response) -> Dict[str, Any]:
+    """Decode a JSON response body with orjson."""
+    return orjson.loads(response.content)
+
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close pooled provider HTTP clients when the MCP server shuts down."""
+    try:
+        yield
+    finally:
+        await search_coordinator.aclose()
+
+
 # Create FastMCP server
-mcp = FastMCP("Web Research Server")
+mcp = FastMCP("Web Research Server", lifespan=server_lifespan)
 
 
 class WebSearchProvider:
@@ -30,6 +90,29 @@ class WebSearchProvider:
     def __init__(self, name: str):
         self.name = name
         self.rate_limit_delay = 1.0  # seconds between requests
+        self._available = True  # computed once; configuration is read at startup
+        self.is_fallback = False  # fallback providers never end the auto search early
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the HTTP client used for this provider's requests."""
+        return httpx.AsyncClient(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        # Pooled connections are bound to the event loop that opened them
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = self._create_client()
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        client, self._client = self._client, None
+        if client is not None and self._client_loop is asyncio.get_running_loop():
+            await client.aclose()
 
     async def search(self, query: str, num_results: int = 10) -> Dict[str, Any]:
         """Perform search and return structured results."""
@@ -37,189 +120,267 @@ class WebSearchProvider:
 
     def is_available(self) -> bool:
         """Check if provider is available and configured."""
-        return True
+        return self._available
+
+
+class _ResultLinkParser(HTMLParser):
+    """Incrementally collects (href, text) pairs of DuckDuckGo lite result links.
+
+    The stdlib parser is pure Python and slower per byte than a C parser such
+    as selectolax, but it can be fed chunks as they arrive, so parsing stops
+    as soon as enough results are found.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.links = deque()
+        self._href: Optional[str] = None
+        self._text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag != 'a':
+            return
+        attributes = dict(attrs)
+        # DDG lite marks organic results with the result-link class
+        if 'result-link' in (attributes.get('class') or '').split():
+            self._href = attributes.get('href') or ''
+            self._text = []
+
+    def handle_data(self, data):
+        if self._href is not None:
+            self._text.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == 'a' and self._href is not None:
+            self.links.append((self._href, ''.join(self._text).strip()))
+            self._href = None
+
+
+# Curated resources used when DuckDuckGo scraping yields nothing, by query keyword
+_CURATED_RESOURCES = {
+    'python': [
+        ('Python Official Documentation', 'https://docs.python.org/',
+         'Official Python documentation with tutorials, library reference, and language reference.'),
+        ('Real Python Tutorials', 'https://realpython.com/',
+         'High-quality Python tutorials, articles, and resources for developers.'),
+        ('Python Package Index (PyPI)', 'https://pypi.org/',
+         'The official repository for Python packages and libraries.')
+    ],
+    'programming': [
+        ('Stack Overflow', 'https://stackoverflow.com/',
+         'Programming Q&A community with millions of questions and answers.'),
+        ('GitHub', 'https://github.com/',
+         'Code hosting platform with millions of open source projects.'),
+        ('MDN Web Docs', 'https://developer.mozilla.org/',
+         'Web development documentation and resources.')
+    ],
+    'javascript': [
+        ('MDN JavaScript Guide', 'https://developer.mozilla.org/en-US/docs/Web/JavaScript',
+         'Comprehensive JavaScript documentation and tutorials.'),
+        ('JavaScript.info', 'https://javascript.info/',
+         'Modern JavaScript tutorial covering basics to advanced topics.'),
+        ('npm Registry', 'https://www.npmjs.com/',
+         'Package manager for JavaScript with millions of packages.')
+    ],
+    'react': [
+        ('React Official Docs', 'https://react.dev/',
+         'Official React documentation with guides and API reference.'),
+        ('React Tutorial', 'https://react.dev/learn',
+         'Interactive tutorial to learn React from scratch.')
+    ],
+    'machine learning': [
+        ('Scikit-learn', 'https://scikit-learn.org/',
+         'Machine learning library for Python with comprehensive documentation.'),
+        ('TensorFlow', 'https://tensorflow.org/',
+         'Open source machine learning platform.'),
+        ('Kaggle Learn', 'https://kaggle.com/learn',
+         'Free machine learning courses and datasets.')
+    ]
+}
+
+# Fallback results prebuilt once at import, keyed by query keyword
+_FALLBACK_PATTERNS = {
+    keyword: tuple(
+        SearchResult(title, url, snippet, 'DuckDuckGo Fallback (Curated)')
+        for title, url, snippet in resources
+    )
+    for keyword, resources in _CURATED_RESOURCES.items()
+}
+
+# Matches any fallback keyword in one pass; longest first so none shadows a longer one
+_FALLBACK_KEYWORD_RE = re.compile('|'.join(
+    re.escape(keyword) for keyword in sorted(_FALLBACK_PATTERNS, key=len, reverse=True)))
+
+
+class _BorrowedSessionTransport(AiohttpTransport):
+    """aiohttp transport over a caller-owned session, which it never closes."""
+
+    async def aclose(self) -> None:
+        pass
 
 
 class DuckDuckGoProvider(WebSearchProvider):
     """DuckDuckGo search provider (no API key required)."""
 
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         super().__init__("DuckDuckGo")
         self.base_url = "https://api.duckduckgo.com"
         self.rate_limit_delay = 1.5  # Be respectful to DDG
-
-    def _generate_fallback_results(self, query: str, num_results: int) -> List[Dict[str, Any]]:
+        self.is_fallback = True
+        # An injected session is owned by the caller and must be used on its loop
+        self._session = session
+
+    def _create_client(self) -> httpx.AsyncClient:
+        # aiohttp does the socket I/O (HTTP/1.1 only); httpx keeps the request/response API
+        if self._session is not None:
+            transport = _BorrowedSessionTransport(client=self._session)
+        else:
+            transport = AiohttpTransport(client=lambda: aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+                trust_env=True,
+            ))
+        return httpx.AsyncClient(transport=transport, timeout=30.0, follow_redirects=True)
+
+    def _generate_fallback_results(self, query: str, num_results: int) -> List[SearchResult]:
         """Generate helpful fallback search results based on query keywords."""
-        # Common search patterns and their useful resources
-        search_patterns = {
-            'python': [
-                ('Python Official Documentation', 'https://docs.python.org/',
-                 'Official Python documentation with tutorials, library reference, and language reference.'),
-                ('Real Python Tutorials', 'https://realpython.com/',
-                 'High-quality Python tutorials, articles, and resources for developers.'),
-                ('Python Package Index (PyPI)', 'https://pypi.org/',
-                 'The official repository for Python packages and libraries.')
-            ],
-            'programming': [
-                ('Stack Overflow', 'https://stackoverflow.com/',
-                 'Programming Q&A community with millions of questions and answers.'),
-                ('GitHub', 'https://github.com/',
-                 'Code hosting platform with millions of open source projects.'),
-                ('MDN Web Docs', 'https://developer.mozilla.org/',
-                 'Web development documentation and resources.')
-            ],
-            'javascript': [
-                ('MDN JavaScript Guide', 'https://developer.mozilla.org/en-US/docs/Web/JavaScript',
-                 'Comprehensive JavaScript documentation and tutorials.'),
-                ('JavaScript.info', 'https://javascript.info/',
-                 'Modern JavaScript tutorial covering basics to advanced topics.'),
-                ('npm Registry', 'https://www.npmjs.com/',
-                 'Package manager for JavaScript with millions of packages.')
-            ],
-            'react': [
-                ('React Official Docs', 'https://react.dev/',
-                 'Official React documentation with guides and API reference.'),
-                ('React Tutorial', 'https://react.dev/learn',
-                 'Interactive tutorial to learn React from scratch.')
-            ],
-            'machine learning': [
-                ('Scikit-learn', 'https://scikit-learn.org/',
-                 'Machine learning library for Python with comprehensive documentation.'),
-                ('TensorFlow', 'https://tensorflow.org/',
-                 'Open source machine learning platform.'),
-                ('Kaggle Learn', 'https://kaggle.com/learn',
-                 'Free machine learning courses and datasets.')
-            ]
+        # Find the first matching keyword in a single scan of the query
+        match = _FALLBACK_KEYWORD_RE.search(query.lower())
+        if match:
+            return list(_FALLBACK_PATTERNS[match.group()][:num_results])
+
+        # Generic fallback if no pattern matches
+        results = [
+            SearchResult(
+                title=f'Search for "{query}" - General Resources',
+                url=f'https://duckduckgo.com/?q={quote_plus(query)}',
+                snippet=f'General search results for "{query}". Click to search directly on DuckDuckGo.',
+                source='DuckDuckGo Direct'
+            )
+        ]
+
+        return results[:num_results]
+
+    async def _scrape_lite_results(self, client: httpx.AsyncClient, query: str,
+                                   num_results: int) -> List[SearchResult]:
+        """Scrape organic results from the DuckDuckGo lite HTML page."""
+        # Use DuckDuckGo HTML search with lite interface
+        search_url = "https://lite.duckduckgo.com/lite"
+        params = {
+            'q': query,
+            'kl': 'us-en'
         }
 
-        query_lower = query.lower()
+        # Stream the page through an incremental parser and stop parsing
+        # once enough results are collected
+        parser = _ResultLinkParser()
         results = []
 
-        # Find matching patterns
-        for pattern, resources in search_patterns.items():
-            if pattern in query_lower:
-                for title, url, snippet in resources[:num_results]:
-                    results.append({
-                        'title': title,
-                        'url': url,
-                        'snippet': snippet,
-                        'source': 'DuckDuckGo Fallback (Curated)'
-                    })
-                break
+        async with client.stream('GET', search_url, params=params) as response:
+            response.raise_for_status()
 
-        # Generic fallback if no pattern matches
-        if not results:
-            results = [
-                {
-                    'title': f'Search for "{query}" - General Resources',
-                    'url': f'https://duckduckgo.com/?q={query.replace(" ", "+")}',
-                    'snippet': f'General search results for "{query}". Click to search directly on DuckDuckGo.',
-                    'source': 'DuckDuckGo Direct'
-                }
-            ]
+            async for chunk in response.aiter_text():
+                # Keep reading the (small) rest of the page without parsing it:
+                # aiohttp closes, rather than pools, a connection whose body
+                # was left unread
+                if len(results) >= num_results:
+                    continue
+                parser.feed(chunk)
 
-        return results[:num_results]
+                while parser.links and len(results) < num_results:
+                    url, title = parser.links.popleft()
 
-    async def search(self, query: str, num_results: int = 10) -> Dict[str, Any]:
-        """Perform DuckDuckGo search using HTML scraping approach."""
-        try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                # Use DuckDuckGo HTML search with lite interface
-                search_url = "https://lite.duckduckgo.com/lite"
-                params = {
-                    'q': query,
-                    'kl': 'us-en'
-                }
-
-                response = await client.get(search_url, params=params)
-                response.raise_for_status()
-
-                # Parse HTML results (simplified parsing)
-                html_content = response.text
-                results = []
-
-                # Extract basic search results from HTML
-                import re
-
-                # Find result links and titles
-                link_pattern = r'<a[^>]+href="([^"]+)"[^>]*>([^<]+)</a>'
-                matches = re.findall(link_pattern, html_content)
-
-                result_count = 0
-                for url, title in matches:
                     # Filter out DuckDuckGo internal links and ads
                     if (not url.startswith('http') or
                         'duckduckgo.com' in url or
                         'javascript:' in url or
-                            len(title.strip()) < 10):
+                            len(title) < 10):
                         continue
 
-                    # Clean up title
-                    title = re.sub(r'<[^>]+>', '', title).strip()
-                    if not title:
-                        continue
+                    results.append(SearchResult(
+                        title=title,
+                        url=url,
+                        snippet=f"Search result for: {query}",
+                        source='DuckDuckGo Search'
+                    ))
+
+        return results
+
+    async def _fetch_instant_answers(self, client: httpx.AsyncClient, query: str,
+                                     num_results: int) -> List[SearchResult]:
+        """Fetch the abstract and related topics from the DuckDuckGo instant answer API."""
+        api_params = {
+            'q': query,
+            'format': 'json',
+            'no_redirect': '1',
+            'no_html': '1',
+            'skip_disambig': '1'
+        }
+
+        api_response = await client.get(self.base_url, params=api_params)
+        api_response.raise_for_status()
 
-                    results.append({
-                        'title': title,
-                        'url': url,
-                        'snippet': f"Search result for: {query}",
-                        'source': 'DuckDuckGo Search'
-                    })
+        data = _parse_json(api_response)
+        results = []
 
-                    result_count += 1
-                    if result_count >= num_results:
-                        break
+        # Add abstract if available
+        if data.get('Abstract') and data.get('AbstractURL'):
+            results.append(SearchResult(
+                title=data.get('Heading', 'DuckDuckGo Summary'),
+                url=data.get('AbstractURL', ''),
+                snippet=data.get('Abstract', ''),
+                source='DuckDuckGo Abstract'
+            ))
+
+        # Add related topics
+        for topic in data.get('RelatedTopics', [])[:num_results]:
+            if isinstance(topic, dict) and 'Text' in topic and topic.get('FirstURL'):
+                results.append(SearchResult(
+                    title=topic.get('Text', '')[:100],
+                    url=topic.get('FirstURL', ''),
+                    snippet=topic.get('Text', ''),
+                    source='DuckDuckGo Related'
+                ))
+
+        return results
+
+    async def search(self, query: str, num_results: int = 10) -> Dict[str, Any]:
+        """Perform DuckDuckGo search using HTML scraping approach."""
+        try:
+            client = self._get_client()
+
+            # The instant answer API is independent of the lite page; start it
+            # now and only wait for it if the scrape leaves room for its answers
+            instant_answers = asyncio.ensure_future(
+                self._fetch_instant_answers(client, query, num_results))
+            try:
+                results = await self._scrape_lite_results(client, query, num_results)
 
                 # Fallback: If HTML parsing didn't work, provide helpful fallback results
                 if not results:
                     # Generate useful search guidance based on query
-                    fallback_results = self._generate_fallback_results(
-                        query, num_results)
-                    results.extend(fallback_results)
+                    results.extend(self._generate_fallback_results(query, num_results))
 
-                    # Also try instant answer API
+                if len(results) < num_results:
                     try:
-                        api_params = {
-                            'q': query,
-                            'format': 'json',
-                            'no_redirect': '1',
-                            'no_html': '1',
-                            'skip_disambig': '1'
-                        }
-
-                        api_response = await client.get(self.base_url, params=api_params)
-                        api_response.raise_for_status()
-
-                        data = api_response.json()
-
-                        # Add abstract if available
-                        if data.get('Abstract') and data.get('AbstractURL'):
-                            results.append({
-                                'title': data.get('Heading', 'DuckDuckGo Summary'),
-                                'url': data.get('AbstractURL', ''),
-                                'snippet': data.get('Abstract', ''),
-                                'source': 'DuckDuckGo Abstract'
-                            })
-
-                        # Add related topics
-                        for topic in data.get('RelatedTopics', [])[:num_results]:
-                            if isinstance(topic, dict) and 'Text' in topic and topic.get('FirstURL'):
-                                results.append({
-                                    'title': topic.get('Text', '')[:100],
-                                    'url': topic.get('FirstURL', ''),
-                                    'snippet': topic.get('Text', ''),
-                                    'source': 'DuckDuckGo Related'
-                                })
-                    except:
-                        pass  # Ignore API errors, use fallback
-
-                return {
-                    'provider': self.name,
-                    'query': query,
-                    'results': results[:num_results],
-                    'total_results': len(results),
-                    'status': 'success' if results else 'no_results'
-                }
+                        results.extend(await instant_answers)
+                    except Exception:
+                        pass  # Instant answers only augment results; API errors are ignored
+            finally:
+                # Drop answers that weren't needed; mark an early API failure as retrieved
+                if not instant_answers.done():
+                    instant_answers.cancel()
+                elif not instant_answers.cancelled():
+                    instant_answers.exception()
+
+            results = results[:num_results]
+            return {
+                'provider': self.name,
+                'query': query,
+                'results': results,
+                'total_results': len(results),
+                'status': 'success' if results else 'no_results'
+            }
 
         except Exception as e:
             return {
@@ -240,9 +401,7 @@ class BingSearchProvider(WebSearchProvider):
         self.api_key = os.getenv('BING_SEARCH_API_KEY')
         self.base_url = "https://api.bing.microsoft.com/v7.0/search"
         self.rate_limit_delay = 0.5
-
-    def is_available(self) -> bool:
-        return bool(self.api_key)
+        self._available = bool(self.api_key)
 
     async def search(self, query: str, num_results: int = 10) -> Dict[str, Any]:
         """Perform Bing search."""
@@ -257,45 +416,44 @@ class BingSearchProvider(WebSearchProvider):
             }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                headers = {
-                    'Ocp-Apim-Subscription-Key': self.api_key,
-                    'Content-Type': 'application/json'
-                }
-
-                params = {
-                    'q': query,
-                    'count': num_results,
-                    'responseFilter': 'Webpages',
-                    'textFormat': 'HTML'
-                }
-
-                response = await client.get(self.base_url, headers=headers, params=params)
-                response.raise_for_status()
-
-                data = response.json()
-
-                results = []
-                if 'webPages' in data and 'value' in data['webPages']:
-                    for item in data['webPages']['value']:
+            client = self._get_client()
+            headers = {
+                'Ocp-Apim-Subscription-Key': self.api_key,
+                'Content-Type': 'application/json'
+            }
+
+            params = {
+                'q': query,
+                'count': num_results,
+                'responseFilter': 'Webpages',
+                'textFormat': 'HTML'
+            }
+
+            response = await client.get(self.base_url, headers=headers, params=params)
+            response.raise_for_status()
+
+            data = _parse_json(response)
+
+            results = []
+            if 'webPages' in data and 'value' in data['webPages']:
+                results_append = results.append
+                for item in data['webPages']['value']:
+                    get = item.get
+                    results_append(SearchResult(
+                        title=get('name') or '',
+                        url=get('url') or '',
                         # Clean HTML from snippet
-                        snippet = re.sub(
-                            r'<[^>]+>', '', item.get('snippet', ''))
-
-                        results.append({
-                            'title': item.get('name', ''),
-                            'url': item.get('url', ''),
-                            'snippet': snippet,
-                            'source': 'Bing Search'
-                        })
-
-                return {
-                    'provider': self.name,
-                    'query': query,
-                    'results': results,
-                    'total_results': len(results),
-                    'status': 'success'
-                }
+                        snippet=_TAG_RE.sub('', get('snippet') or ''),
+                        source='Bing Search'
+                    ))
+
+            return {
+                'provider': self.name,
+                'query': query,
+                'results': results,
+                'total_results': len(results),
+                'status': 'success'
+            }
 
         except Exception as e:
             return {
@@ -317,9 +475,7 @@ class GoogleSearchProvider(WebSearchProvider):
         self.search_engine_id = os.getenv('GOOGLE_SEARCH_ENGINE_ID')
         self.base_url = "https://www.googleapis.com/customsearch/v1"
         self.rate_limit_delay = 0.1
-
-    def is_available(self) -> bool:
-        return bool(self.api_key and self.search_engine_id)
+        self._available = bool(self.api_key and self.search_engine_id)
 
     async def search(self, query: str, num_results: int = 10) -> Dict[str, Any]:
         """Perform Google Custom Search."""
@@ -334,37 +490,37 @@ class GoogleSearchProvider(WebSearchProvider):
             }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                params = {
-                    'key': self.api_key,
-                    'cx': self.search_engine_id,
-                    'q': query,
-                    # Google limits to 10 per request
-                    'num': min(num_results, 10)
-                }
-
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
-
-                data = response.json()
-
-                results = []
-                if 'items' in data:
-                    for item in data['items']:
-                        results.append({
-                            'title': item.get('title', ''),
-                            'url': item.get('link', ''),
-                            'snippet': item.get('snippet', ''),
-                            'source': 'Google Search'
-                        })
-
-                return {
-                    'provider': self.name,
-                    'query': query,
-                    'results': results,
-                    'total_results': len(results),
-                    'status': 'success'
-                }
+            client = self._get_client()
+            params = {
+                'key': self.api_key,
+                'cx': self.search_engine_id,
+                'q': query,
+                # Google limits to 10 per request
+                'num': min(num_results, 10)
+            }
+
+            response = await client.get(self.base_url, params=params)
+            response.raise_for_status()
+
+            data = _parse_json(response)
+
+            results = []
+            if 'items' in data:
+                for item in data['items']:
+                    results.append(SearchResult(
+                        title=item.get('title', ''),
+                        url=item.get('link', ''),
+                        snippet=item.get('snippet', ''),
+                        source='Google Search'
+                    ))
+
+            return {
+                'provider': self.name,
+                'query': query,
+                'results': results,
+                'total_results': len(results),
+                'status': 'success'
+            }
 
         except Exception as e:
             return {
@@ -386,81 +542,182 @@ class WebSearchCoordinator:
             BingSearchProvider(),
             DuckDuckGoProvider(),  # DDG as fallback (no API key required)
         ]
+        self._providers_by_name = {p.name.lower(): p for p in self.providers}
         self.last_request_time = {}
+        self._rate_limit_locks: Dict[str, asyncio.Lock] = {}
+        self._rate_limit_loop: Optional[asyncio.AbstractEventLoop] = None
+        # (provider, query, num_results) -> (timestamp, result), in LRU order
+        self._cache: "OrderedDict[Tuple[str, str, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def _cache_get(self, key: Tuple[str, str, int]) -> Optional[Dict[str, Any]]:
+        """Return a copy of a fresh cached result, if any."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        timestamp, result = entry
+        if time.monotonic() - timestamp >= CACHE_TTL:
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def _cache_put(self, key: Tuple[str, str, int], result: Dict[str, Any]):
+        """Cache a successful result, evicting the least recently used entries."""
+        if result['status'] != 'success':
+            return
+
+        self._cache[key] = (time.monotonic(), copy.deepcopy(result))
+        self._cache.move_to_end(key)
+        while len(self._cache) > CACHE_MAX_SIZE:
+            self._cache.popitem(last=False)
+
+    async def aclose(self):
+        """Close the HTTP clients held by all providers."""
+        await asyncio.gather(*(provider.aclose() for provider in self.providers))
 
     async def _respect_rate_limit(self, provider: WebSearchProvider):
-        """Ensure rate limiting for provider."""
+        """Ensure rate limiting for provider, serializing concurrent callers."""
+        loop = asyncio.get_running_loop()
+        # asyncio locks are bound to the event loop they are first used on
+        if loop is not self._rate_limit_loop:
+            self._rate_limit_locks = {}
+            self._rate_limit_loop = loop
+
         provider_name = provider.name
-        current_time = asyncio.get_event_loop().time()
+        async with self._rate_limit_locks.setdefault(provider_name, asyncio.Lock()):
+            last_request = self.last_request_time.get(provider_name)
+            if last_request is not None:
+                delay = provider.rate_limit_delay - (time.monotonic() - last_request)
+                if delay > 0:
+                    await asyncio.sleep(delay)
 
-        if provider_name in self.last_request_time:
-            time_since_last = current_time - \
-                self.last_request_time[provider_name]
-            if time_since_last < provider.rate_limit_delay:
-                await asyncio.sleep(provider.rate_limit_delay - time_since_last)
+            self.last_request_time[provider_name] = time.monotonic()
 
-        self.last_request_time[provider_name] = asyncio.get_event_loop().time()
+    async def _search_provider(self, provider: WebSearchProvider, query: str, num_results: int) -> Dict[str, Any]:
+        """Search a single provider, respecting its rate limit."""
+        await self._respect_rate_limit(provider)
+        return await provider.search(query, num_results)
 
     async def search_multi_provider(self, query: str, num_results: int = 10) -> Dict[str, Any]:
         """Search using multiple providers with intelligent fallback."""
+        cache_key = ('auto', query, num_results)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Providers hit different hosts, so query them concurrently
+        available = [p for p in self.providers if p.is_available()]
+        tasks = {
+            asyncio.ensure_future(self._search_provider(p, query, num_results)): p
+            for p in available
+        }
+        outcomes = {}
+        pending = set(tasks)
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                enough_results = False
+
+                for task in done:
+                    provider = tasks[task]
+                    if task.exception() is not None:
+                        result = {
+                            'provider': provider.name,
+                            'query': query,
+                            'results': [],
+                            'total_results': 0,
+                            'status': 'error',
+                            'error': str(task.exception())
+                        }
+                    else:
+                        result = task.result()
+                    outcomes[provider] = result
+
+                    if (not provider.is_fallback and result['status'] == 'success'
+                            and len(result['results']) >= num_results):
+                        enough_results = True
+
+                # A primary provider already filled the request; skip the rest
+                if enough_results:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+
+        # Merge in provider priority order, regardless of completion order
         all_results = []
         provider_statuses = []
 
-        for provider in self.providers:
-            if provider.is_available():
-                await self._respect_rate_limit(provider)
-                result = await provider.search(query, num_results)
-
+        for provider in available:
+            result = outcomes.get(provider)
+            if result is None:
                 provider_statuses.append({
                     'provider': provider.name,
-                    'status': result['status'],
-                    'results_count': result['total_results']
+                    'status': 'skipped',
+                    'results_count': 0
                 })
+                continue
 
-                if result['status'] == 'success' and result['results']:
-                    all_results.extend(result['results'])
+            provider_statuses.append({
+                'provider': provider.name,
+                'status': result['status'],
+                'results_count': result['total_results']
+            })
 
-        # Remove duplicates based on URL
-        seen_urls = set()
-        unique_results = []
+            if result['status'] == 'success' and result['results']:
+                all_results.extend(result['results'])
+
+        # Remove duplicates based on normalized URL, keeping the first occurrence
+        unique = {}
         for result in all_results:
-            url = result.get('url', '')
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique_results.append(result)
+            if result.url:
+                unique.setdefault(_normalize_url(result.url), result)
+        unique_results = list(unique.values())
 
-        return {
+        response = {
             'query': query,
             'results': unique_results[:num_results],
             'total_results': len(unique_results),
             'providers_used': provider_statuses,
             'status': 'success' if unique_results else 'no_results'
         }
+        self._cache_put(cache_key, response)
+        return response
 
     async def search_single_provider(self, query: str, provider_name: str, num_results: int = 10) -> Dict[str, Any]:
         """Search using a specific provider."""
-        for provider in self.providers:
-            if provider.name.lower() == provider_name.lower():
-                if provider.is_available():
-                    await self._respect_rate_limit(provider)
-                    return await provider.search(query, num_results)
-                else:
-                    return {
-                        'provider': provider.name,
-                        'query': query,
-                        'results': [],
-                        'total_results': 0,
-                        'status': 'error',
-                        'error': f'{provider.name} provider not available or not configured'
-                    }
-
-        return {
-            'query': query,
-            'results': [],
-            'total_results': 0,
-            'status': 'error',
-            'error': f'Provider "{provider_name}" not found'
-        }
+        provider = self._providers_by_name.get(provider_name.lower())
+        if provider is None:
+            return {
+                'query': query,
+                'results': [],
+                'total_results': 0,
+                'status': 'error',
+                'error': f'Provider "{provider_name}" not found'
+            }
+
+        if not provider.is_available():
+            return {
+                'provider': provider.name,
+                'query': query,
+                'results': [],
+                'total_results': 0,
+                'status': 'error',
+                'error': f'{provider.name} provider not available or not configured'
+            }
+
+        # Validated first, so a name like 'auto' can't hit the merged search's entries
+        cache_key = (provider.name, query, num_results)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = await self._search_provider(provider, query, num_results)
+        self._cache_put(cache_key, result)
+        return result
 
 
 # Initialize coordinator
@@ -491,22 +748,25 @@ async def web_search(query: str, num_results: int = 10, provider: str = "auto")
             result = await search_coordinator.search_single_provider(query, provider, num_results)
 
         if result['status'] == 'success' and result['results']:
-            formatted_results = f"Web Search Results for: '{query}'\n"
-            formatted_results += "=" * (len(formatted_results) - 1) + "\n\n"
+            header = f"Web Search Results for: '{query}'"
+            lines = [header, "=" * len(header), ""]
 
             for i, item in enumerate(result['results'], 1):
-                formatted_results += f"{i}. **{item['title']}**\n"
-                formatted_results += f"   URL: {item['url']}\n"
-                formatted_results += f"   Snippet: {item['snippet']}\n"
-                formatted_results += f"   Source: {item['source']}\n\n"
+                lines.append(f"{i}. **{item.title}**")
+                lines.append(f"   URL: {item.url}")
+                lines.append(f"   Snippet: {item.snippet}")
+                lines.append(f"   Source: {item.source}")
+                lines.append("")
 
             # Add provider information
             if 'providers_used' in result:
-                formatted_results += "\nProvider Status:\n"
+                lines.append("")
+                lines.append("Provider Status:")
                 for prov in result['providers_used']:
-                    formatted_results += f"- {prov['provider']}: {prov['status']} ({prov['results_count']} results)\n"
+                    lines.append(f"- {prov['provider']}: {prov['status']} ({prov['results_count']} results)")
 
-            return formatted_results
+            lines.append("")
+            return "\n".join(lines)
 
         elif result['status'] == 'no_results':
             return f"No search results found for: '{query}'\n\nProvider attempts made but no results returned."
@@ -554,10 +814,14 @@ async def research_topic(topic: str, depth: str = "standard") -> str:
             ]
             results_per_query = 6
 
-        # Perform searches
+        # Perform searches concurrently; per-provider rate limits still apply
+        search_results = await asyncio.gather(*(
+            search_coordinator.search_multi_provider(query, results_per_query)
+            for query in search_queries
+        ))
+
         all_research = []
-        for query in search_queries:
-            result = await search_coordinator.search_multi_provider(query, results_per_query)
+        for query, result in zip(search_queries, search_results):
             if result['status'] == 'success':
                 all_research.append({
                     'query': query,
@@ -565,25 +829,33 @@ async def research_topic(topic: str, depth: str = "standard") -> str:
                 })
 
         # Format comprehensive research report
-        report = f"Research Report: {topic}\n"
-        report += "=" * (len(f"Research Report: {topic}")) + "\n\n"
-        report += f"Research Depth: {depth.title()}\n"
-        report += f"Search Queries: {len(search_queries)}\n"
-        report += f"Total Sources Found: {sum(len(r['results']) for r in all_research)}\n\n"
+        header = f"Research Report: {topic}"
+        lines = [
+            header,
+            "=" * len(header),
+            "",
+            f"Research Depth: {depth.title()}",
+            f"Search Queries: {len(search_queries)}",
+            f"Total Sources Found: {sum(len(r['results']) for r in all_research)}",
+            "",
+        ]
 
         for i, research in enumerate(all_research, 1):
-            report += f"## Search Topic {i}: {research['query']}\n\n"
+            lines.append(f"## Search Topic {i}: {research['query']}")
+            lines.append("")
 
             for j, result in enumerate(research['results'], 1):
-                report += f"{j}. **{result['title']}**\n"
-                report += f"   URL: {result['url']}\n"
-                report += f"   Summary: {result['snippet']}\n"
-                report += f"   Source: {result['source']}\n\n"
+                lines.append(f"{j}. **{result.title}**")
+                lines.append(f"   URL: {result.url}")
+                lines.append(f"   Summary: {result.snippet}")
+                lines.append(f"   Source: {result.source}")
+                lines.append("")
 
         if not all_research:
-            report += "No research results found. Please check your topic or try different search terms.\n"
+            lines.append("No research results found. Please check your topic or try different search terms.")
 
-        return report
+        lines.append("")
+        return "\n".join(lines)
 
     except Exception as e:
         return f"Research failed for topic: '{topic}'\nError: {str(e)}"
@@ -598,31 +870,36 @@ async def search_status() -> str:
         Status report of all configured search providers
     """
 
-    status_report = "Web Search Provider Status\n"
-    status_report += "==========================\n\n"
+    lines = ["Web Search Provider Status", "==========================", ""]
 
     for provider in search_coordinator.providers:
-        status_report += f"**{provider.name}**\n"
-        status_report += f"- Available: {'✓ Yes' if provider.is_available() else '✗ No (configuration needed)'}\n"
-        status_report += f"- Rate Limit: {provider.rate_limit_delay}s between requests\n"
+        lines.append(f"**{provider.name}**")
+        lines.append(f"- Available: {'✓ Yes' if provider.is_available() else '✗ No (configuration needed)'}")
+        lines.append(f"- Rate Limit: {provider.rate_limit_delay}s between requests")
 
         # Add configuration hints
         if provider.name == "Google" and not provider.is_available():
-            status_report += "- Config: Set GOOGLE_SEARCH_API_KEY and GOOGLE_SEARCH_ENGINE_ID environment variables\n"
+            lines.append("- Config: Set GOOGLE_SEARCH_API_KEY and GOOGLE_SEARCH_ENGINE_ID environment variables")
         elif provider.name == "Bing" and not provider.is_available():
-            status_report += "- Config: Set BING_SEARCH_API_KEY environment variable\n"
+            lines.append("- Config: Set BING_SEARCH_API_KEY environment variable")
         elif provider.name == "DuckDuckGo":
-            status_report += "- Config: No API key required (always available)\n"
+            lines.append("- Config: No API key required (always available)")
 
-        status_report += "\n"
+        lines.append("")
 
     available_count = sum(
         1 for p in search_coordinator.providers if p.is_available())
-    status_report += f"Summary: {available_count}/{len(search_coordinator.providers)} providers available\n"
+    lines.append(f"Summary: {available_count}/{len(search_coordinator.providers)} providers available")
 
-    return status_report
+    lines.append("")
+    return "\n".join(lines)
 
 
 if __name__ == "__main__":
-    # Run the MCP server
-    mcp.run(transport='stdio')
+    # Run the MCP server, on uvloop's libuv event loop where available
+    try:
+        import uvloop
+    except ImportError:  # uvloop does not support Windows
+        mcp.run(transport='stdio')
+    else:
+        uvloop.run(mcp.run_stdio_async())
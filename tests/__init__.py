@@ -1,5 +1 @@
 # Web Research MCP Server Tests
-<<<<<<< HEAD
-
-=======
->>>>>>> origin/main
@@ -7,32 +7,269 @@ Mission: T83 Custom MCP Development
 """
 
 from web_search import (
+    SearchResult,
+    WebSearchProvider,
     DuckDuckGoProvider,
     BingSearchProvider,
     GoogleSearchProvider,
     WebSearchCoordinator,
+    search_coordinator,
     web_search,
     research_topic,
-    search_status
+    search_status,
+    _BorrowedSessionTransport
 )
 import unittest
 import asyncio
-import sys
+import aiohttp
+import functools
+import re
+import httpx
+import time
 import os
+from unittest.mock import AsyncMock, patch
+
+# Serial live-network tests only run when FULL_TESTS is set; the fast run
+# covers the same calls through the combined concurrent test.
+FULL_TESTS = bool(os.getenv('FULL_TESTS'))
+LIVE_SKIP_REASON = "serial live check; set FULL_TESTS=1 to run"
+
+# Headers web_search opens its report with: results, no results, or a failure
+_TOOL_SENTINELS = ("Web Search Results", "No search results found", "Search failed")
+
+# Premium provider configuration, read once at import
+BING_KEY = bool(os.getenv('BING_SEARCH_API_KEY'))
+GOOGLE_KEY = bool(
+    os.getenv('GOOGLE_SEARCH_API_KEY') and os.getenv('GOOGLE_SEARCH_ENGINE_ID'))
+
+
+class CircuitBreaker:
+    """Fail fast after repeated provider errors, so an outage costs one timeout.
+
+    Once ``threshold`` consecutive calls fail (raise, or return an error
+    status), the breaker opens and calls return ``open_result`` without
+    being made. After ``reset_after`` seconds a single trial call is let
+    through; concurrent callers still get ``open_result`` until it settles.
+    """
+
+    def __init__(self, threshold: int = 3, reset_after: float = 30.0):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.failures = 0
+        self.open_until = 0.0
+        self._trial_in_flight = False
+
+    def _record_failure(self):
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.open_until = time.monotonic() + self.reset_after
+
+    async def call(self, coro_fn, open_result: dict) -> dict:
+        if time.monotonic() < self.open_until:
+            return open_result
+        trial = self.failures >= self.threshold
+        if trial:
+            if self._trial_in_flight:
+                return open_result
+            self._trial_in_flight = True
+        try:
+            result = await coro_fn()
+        except Exception:
+            self._record_failure()
+            raise
+        finally:
+            if trial:
+                self._trial_in_flight = False
+        if result.get('status') == 'error':
+            self._record_failure()
+        else:
+            self.failures = 0
+        return result
+
+
+# Session-wide memo of live DuckDuckGo responses, keyed on
+# (provider, query, num_results). Several tests repeat the same queries;
+# serving them from here avoids re-hitting DDG and its rate limit.
+SEARCH_CACHE_TTL = 300.0
+SEARCH_CACHE: dict[tuple, tuple[float, dict]] = {}
+DDG_BREAKER = CircuitBreaker()
+_ORIGINAL_DDG_SEARCH = DuckDuckGoProvider.search
+
+
+async def cached_search(provider, query: str, num_results: int = 10):
+    """DuckDuckGoProvider.search, memoised for SEARCH_CACHE_TTL seconds."""
+    key = (provider.name, query, num_results)
+    hit = SEARCH_CACHE.get(key)
+    if hit is not None and time.monotonic() - hit[0] < SEARCH_CACHE_TTL:
+        result = hit[1]
+    else:
+        result = await DDG_BREAKER.call(
+            lambda: _ORIGINAL_DDG_SEARCH(provider, query, num_results),
+            open_result={
+                'provider': provider.name,
+                'query': query,
+                'results': [],
+                'total_results': 0,
+                'status': 'error',
+                'error': 'circuit_open'
+            })
+        # Errors are not cached so a transient failure can recover
+        if result.get('status') == 'error':
+            return result
+        SEARCH_CACHE[key] = (time.monotonic(), result)
+    return {**result, 'results': list(result['results'])}
+
+
+# research_topic reports, memoised the same way; async_lru's alru_cache
+# clears itself whenever the event loop changes, i.e. on every test here
+RESEARCH_CACHE: dict[tuple, tuple[float, str]] = {}
+
+
+async def cached_research(topic: str, depth: str = "standard") -> str:
+    """research_topic, memoised for SEARCH_CACHE_TTL seconds."""
+    key = (topic, depth)
+    hit = RESEARCH_CACHE.get(key)
+    if hit is not None and time.monotonic() - hit[0] < SEARCH_CACHE_TTL:
+        return hit[1]
+    report = await research_topic(topic, depth=depth)
+    if not report.startswith("Research failed"):
+        RESEARCH_CACHE[key] = (time.monotonic(), report)
+    return report
+
+
+def setUpModule():
+    DuckDuckGoProvider.search = cached_search
+
+
+def tearDownModule():
+    DuckDuckGoProvider.search = _ORIGINAL_DDG_SEARCH
+    SEARCH_CACHE.clear()
+    RESEARCH_CACHE.clear()
+
+
+class StubProvider(WebSearchProvider):
+    """Offline provider that counts how often it is searched."""
+
+    def __init__(self, name: str = "Stub", delay: float = 0, urls=None):
+        super().__init__(name)
+        self.rate_limit_delay = 0
+        self.delay = delay
+        self.urls = urls  # fixed result URLs; generated per result when None
+        self.calls = 0
+
+    async def search(self, query: str, num_results: int = 10):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        urls = self.urls or [f'https://{self.name.lower()}.example.com/{i}'
+                             for i in range(num_results)]
+        results = [SearchResult(
+            title=f'{self.name} result {i} for {query}',
+            url=url,
+            snippet='Stub result',
+            source=self.name
+        ) for i, url in enumerate(urls[:num_results])]
+        return {
+            'provider': self.name,
+            'query': query,
+            'results': results,
+            'total_results': len(results),
+            'status': 'success'
+        }
+
+
+CANNED_LITE_HTML = """
+<html><body><table>
+<tr><td><a rel="nofollow" href="https://www.python.org/" class="result-link">Welcome to Python.org</a></td></tr>
+<tr><td><a rel="nofollow" href="https://docs.python.org/3/tutorial/" class="result-link">The Python Tutorial</a></td></tr>
+<tr><td><a href="https://duckduckgo.com/settings" class="result-link">DuckDuckGo Settings</a></td></tr>
+</table></body></html>
+"""
+
+CANNED_INSTANT_ANSWER = {
+    'Heading': 'Python (programming language)',
+    'Abstract': 'Python is a high-level, general-purpose programming language.',
+    'AbstractURL': 'https://en.wikipedia.org/wiki/Python_(programming_language)',
+    'RelatedTopics': []
+}
+
+
+def canned_ddg_handler(request: httpx.Request) -> httpx.Response:
+    """Serve canned DuckDuckGo lite and instant answer responses."""
+    if request.url.host == 'lite.duckduckgo.com':
+        return httpx.Response(200, text=CANNED_LITE_HTML)
+    return httpx.Response(200, json=CANNED_INSTANT_ANSWER)
+
+
+FULL_LITE_HTML = "<html><body><table>" + "".join(
+    f'<tr><td><a href="https://example.org/{i}" class="result-link">Example result number {i}</a></td></tr>'
+    for i in range(8)
+) + "</table></body></html>"
+
+
+async def slow_instant_answer_handler(request: httpx.Request) -> httpx.Response:
+    """Serve a full lite results page; the instant answer API stalls."""
+    if request.url.host == 'lite.duckduckgo.com':
+        return httpx.Response(200, text=FULL_LITE_HTML)
+    await asyncio.sleep(5)
+    return httpx.Response(200, json=CANNED_INSTANT_ANSWER)
+
+
+def unreachable_handler(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("network unreachable", request=request)
+
+
+class MockedDuckDuckGoProvider(DuckDuckGoProvider):
+    """DuckDuckGo provider whose HTTP client is served by a mock transport."""
+
+    def __init__(self, handler=canned_ddg_handler):
+        super().__init__()
+        self.handler = handler
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+    async def search(self, query: str, num_results: int = 10):
+        # Bypass the module's live-response cache
+        return await _ORIGINAL_DDG_SEARCH(self, query, num_results)
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+@functools.lru_cache(maxsize=None)
+def _needle_pattern(needles: tuple) -> re.Pattern:
+    """Compile one alternation matching any of the needles, longest first."""
+    return re.compile('|'.join(
+        re.escape(needle) for needle in sorted(needles, key=len, reverse=True)))
 
-class TestWebSearchProviders(unittest.TestCase):
+
+class ContainsAllMixin:
+    """Assertion checking several substrings with one scan of the text."""
+
+    def assert_all_in(self, haystack: str, *needles: str):
+        found = set(_needle_pattern(needles).findall(haystack))
+        # Matches don't overlap, so a needle sharing text with another
+        # may be hidden by it; check those directly
+        missing = [n for n in needles if n not in found and n not in haystack]
+        if missing:
+            self.fail(f"{missing!r} not found in {haystack!r}")
+
+
+class TestWebSearchProviders(unittest.IsolatedAsyncioTestCase):
     """Test individual search providers."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_query = "Python programming"
-        self.ddg_provider = DuckDuckGoProvider()
-        self.bing_provider = BingSearchProvider()
-        self.google_provider = GoogleSearchProvider()
+    @classmethod
+    def setUpClass(cls):
+        """Set up providers shared by every test in the class."""
+        cls.test_query = "Python programming"
+        cls.ddg_provider = DuckDuckGoProvider()
+        cls.bing_provider = BingSearchProvider()
+        cls.google_provider = GoogleSearchProvider()
+
+    async def asyncTearDown(self):
+        """Close HTTP clients bound to this test's event loop."""
+        await asyncio.gather(
+            self.ddg_provider.aclose(),
+            self.bing_provider.aclose(),
+            self.google_provider.aclose()
+        )
 
     def test_duckduckgo_availability(self):
         """Test DDG provider is always available (no API key required)."""
@@ -46,7 +283,11 @@ class TestWebSearchProviders(unittest.TestCase):
 
     async def test_duckduckgo_search(self):
         """Test DuckDuckGo search functionality."""
-        result = await self.ddg_provider.search(self.test_query, num_results=5)
+        provider = MockedDuckDuckGoProvider()
+        try:
+            result = await provider.search(self.test_query, num_results=5)
+        finally:
+            await provider.aclose()
 
         # Verify response structure
         self.assertIn('provider', result)
@@ -55,28 +296,81 @@ class TestWebSearchProviders(unittest.TestCase):
         self.assertIn('status', result)
         self.assertEqual(result['provider'], 'DuckDuckGo')
         self.assertEqual(result['query'], self.test_query)
-
-        # Should either succeed or fail gracefully
-        self.assertIn(result['status'], ['success', 'error'])
-
-    def test_api_key_detection(self):
-        """Test API key detection for premium providers."""
-        # These should reflect actual environment configuration
-        bing_available = bool(os.getenv('BING_SEARCH_API_KEY'))
-        google_available = bool(
-            os.getenv('GOOGLE_SEARCH_API_KEY') and os.getenv('GOOGLE_SEARCH_ENGINE_ID'))
-
-        self.assertEqual(self.bing_provider.is_available(), bing_available)
-        self.assertEqual(self.google_provider.is_available(), google_available)
-
-
-class TestWebSearchCoordinator(unittest.TestCase):
+        self.assertEqual(result['status'], 'success')
+
+        # Lite links to DuckDuckGo itself are filtered; the abstract is appended
+        urls = [r.url for r in result['results']]
+        self.assertEqual(urls, [
+            'https://www.python.org/',
+            'https://docs.python.org/3/tutorial/',
+            CANNED_INSTANT_ANSWER['AbstractURL']
+        ])
+
+    async def test_duckduckgo_full_scrape_skips_instant_answers(self):
+        """Test a scrape that fills the quota doesn't wait on the instant answer API."""
+        provider = MockedDuckDuckGoProvider(slow_instant_answer_handler)
+        try:
+            start = time.monotonic()
+            result = await provider.search(self.test_query, num_results=5)
+            elapsed = time.monotonic() - start
+        finally:
+            await provider.aclose()
+
+        self.assertLess(elapsed, 1)
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(len(result['results']), 5)
+        self.assertEqual(result['total_results'], 5)
+        self.assertEqual({r.source for r in result['results']}, {'DuckDuckGo Search'})
+
+    async def test_duckduckgo_shared_session(self):
+        """Test an injected aiohttp session is used and left open."""
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+                limit=20, ttl_dns_cache=300, keepalive_timeout=60)) as session:
+            provider = DuckDuckGoProvider(session=session)
+            client = provider._get_client()
+
+            # Requests go through a transport wrapping the caller's session
+            self.assertIsInstance(client._transport, _BorrowedSessionTransport)
+            self.assertIs(client._transport.client, session)
+
+            await provider.aclose()
+
+            self.assertTrue(client.is_closed)
+            self.assertFalse(session.closed)
+
+    @unittest.skipUnless(BING_KEY, "BING_SEARCH_API_KEY not set")
+    def test_bing_api_key_detection(self):
+        """Test Bing is available when its API key is configured."""
+        self.assertTrue(self.bing_provider.is_available())
+
+    @unittest.skipUnless(GOOGLE_KEY, "GOOGLE_SEARCH_API_KEY/GOOGLE_SEARCH_ENGINE_ID not set")
+    def test_google_api_key_detection(self):
+        """Test Google is available when its API key and engine ID are configured."""
+        self.assertTrue(self.google_provider.is_available())
+
+    def test_unconfigured_providers_unavailable(self):
+        """Test premium providers report unavailable without API keys."""
+        # Availability is read in __init__, so build the providers inside the patch
+        with patch.dict(os.environ, {}, clear=True):
+            bing_provider = BingSearchProvider()
+            google_provider = GoogleSearchProvider()
+
+        self.assertFalse(bing_provider.is_available())
+        self.assertFalse(google_provider.is_available())
+
+
+class TestWebSearchCoordinator(unittest.IsolatedAsyncioTestCase):
     """Test the web search coordinator."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.coordinator = WebSearchCoordinator()
-        self.test_query = "artificial intelligence"
+    @classmethod
+    def setUpClass(cls):
+        """Set up a coordinator shared by every test in the class."""
+        cls.coordinator = WebSearchCoordinator()
+        cls.test_query = "artificial intelligence"
+
+    async def asyncTearDown(self):
+        """Close HTTP clients bound to this test's event loop."""
+        await self.coordinator.aclose()
 
     def test_coordinator_initialization(self):
         """Test coordinator has providers."""
@@ -86,6 +380,7 @@ class TestWebSearchCoordinator(unittest.TestCase):
         provider_names = [p.name for p in self.coordinator.providers]
         self.assertIn('DuckDuckGo', provider_names)
 
+    @unittest.skipUnless(FULL_TESTS, LIVE_SKIP_REASON)
     async def test_multi_provider_search(self):
         """Test multi-provider search with fallback."""
         result = await self.coordinator.search_multi_provider(self.test_query, num_results=5)
@@ -100,6 +395,7 @@ class TestWebSearchCoordinator(unittest.TestCase):
         # Should at least try DDG (always available)
         self.assertGreater(len(result['providers_used']), 0)
 
+    @unittest.skipUnless(FULL_TESTS, LIVE_SKIP_REASON)
     async def test_single_provider_search(self):
         """Test targeting specific provider."""
         result = await self.coordinator.search_single_provider(self.test_query, "duckduckgo", num_results=3)
@@ -107,6 +403,98 @@ class TestWebSearchCoordinator(unittest.TestCase):
         self.assertIn('provider', result)
         self.assertEqual(result['provider'], 'DuckDuckGo')
 
+    async def test_live_searches_parallel(self):
+        """Test several live multi-provider searches issued concurrently."""
+        queries = ["Python programming", "artificial intelligence",
+                   "machine learning", "blockchain"]
+        results = await asyncio.gather(*(
+            self.coordinator.search_multi_provider(q, num_results=3)
+            for q in queries
+        ), return_exceptions=True)
+
+        for query, result in zip(queries, results):
+            with self.subTest(query=query):
+                self.assertNotIsInstance(result, BaseException)
+                self.assertIn('results', result)
+                self.assertIn('providers_used', result)
+                self.assertIn('status', result)
+                self.assertEqual(result['query'], query)
+                self.assertGreater(len(result['providers_used']), 0)
+
+    async def test_repeated_search_uses_cache(self):
+        """Test repeated identical searches are served from the cache."""
+        stub = StubProvider()
+        coordinator = WebSearchCoordinator()
+        coordinator.providers = [stub]
+
+        first = await coordinator.search_multi_provider(self.test_query, num_results=3)
+        second = await coordinator.search_multi_provider(self.test_query, num_results=3)
+
+        self.assertEqual(stub.calls, 1)
+        self.assertEqual(first, second)
+
+        # Different result counts are cached separately
+        await coordinator.search_multi_provider(self.test_query, num_results=5)
+        self.assertEqual(stub.calls, 2)
+
+    async def test_concurrent_searches_respect_rate_limit(self):
+        """Test concurrent searches to one provider are spaced by its rate limit."""
+        stub = StubProvider()
+        stub.rate_limit_delay = 0.05
+        coordinator = WebSearchCoordinator()
+        coordinator.providers = [stub]
+
+        start = time.monotonic()
+        await asyncio.gather(*(
+            coordinator.search_multi_provider(f"query {i}", num_results=1)
+            for i in range(3)
+        ))
+
+        self.assertEqual(stub.calls, 3)
+        self.assertGreaterEqual(time.monotonic() - start, 2 * stub.rate_limit_delay)
+
+    async def test_primary_provider_short_circuits_fallback(self):
+        """Test a primary provider with enough results skips slower fallbacks."""
+        primary = StubProvider("Primary")
+        fallback = StubProvider("Fallback", delay=5)
+        fallback.is_fallback = True
+        coordinator = WebSearchCoordinator()
+        coordinator.providers = [primary, fallback]
+
+        start = time.monotonic()
+        result = await coordinator.search_multi_provider(self.test_query, num_results=3)
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(len(result['results']), 3)
+        statuses = {p['provider']: p['status'] for p in result['providers_used']}
+        self.assertEqual(statuses, {'Primary': 'success', 'Fallback': 'skipped'})
+
+    async def test_merged_results_dedupe_normalized_urls(self):
+        """Test URLs differing only in case, trailing slash or tracking params merge."""
+        first = StubProvider("First", urls=[
+            'https://Example.com/page/',
+            'http://[bad/x',
+            'https://example.com/a?utm_source=feed&id=1'
+        ])
+        second = StubProvider("Second", urls=[
+            'HTTPS://example.com/page',
+            'https://example.com/a?id=1&fbclid=abc',
+            'http://[bad/x',
+            'https://example.com/other'
+        ])
+        coordinator = WebSearchCoordinator()
+        coordinator.providers = [first, second]
+
+        result = await coordinator.search_multi_provider(self.test_query, num_results=10)
+
+        # Higher-priority providers keep their copy; malformed URLs dedupe verbatim
+        self.assertEqual([r.url for r in result['results']], [
+            'https://Example.com/page/',
+            'http://[bad/x',
+            'https://example.com/a?utm_source=feed&id=1',
+            'https://example.com/other'
+        ])
+
     async def test_invalid_provider_handling(self):
         """Test handling of invalid provider names."""
         result = await self.coordinator.search_single_provider(self.test_query, "invalid_provider", num_results=3)
@@ -114,14 +502,49 @@ class TestWebSearchCoordinator(unittest.TestCase):
         self.assertEqual(result['status'], 'error')
         self.assertIn('not found', result['error'])
 
+    async def test_auto_is_not_a_single_provider(self):
+        """Test the merged search's cache entries aren't served as a provider named auto."""
+        coordinator = WebSearchCoordinator()
+        coordinator.providers = [StubProvider()]
+        await coordinator.search_multi_provider(self.test_query, num_results=3)
+
+        result = await coordinator.search_single_provider(self.test_query, "auto", num_results=3)
+
+        self.assertEqual(result['status'], 'error')
+        self.assertIn('not found', result['error'])
+
 
-class TestMCPTools(unittest.TestCase):
+class TestMCPTools(ContainsAllMixin, unittest.IsolatedAsyncioTestCase):
     """Test the MCP tool functions."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures."""
-        self.test_query = "machine learning"
+        cls.test_query = "machine learning"
+
+    async def asyncTearDown(self):
+        """Close the server coordinator's clients bound to this test's loop."""
+        await search_coordinator.aclose()
+
+    async def test_all_mcp_tools(self):
+        """Test all MCP tools with their I/O issued concurrently."""
+        search, research, status = await asyncio.gather(
+            web_search(self.test_query, num_results=3, provider="auto"),
+            cached_research("Python", depth="quick"),
+            search_status()
+        )
+
+        self.assertIsInstance(search, str)
+        self.assertIn(self.test_query, search)
+        self.assertTrue(any(s in search for s in _TOOL_SENTINELS))
+
+        self.assertIsInstance(research, str)
+        self.assert_all_in(research, "Research Report", "Python")
+
+        self.assertIsInstance(status, str)
+        self.assert_all_in(status, "Provider Status", "DuckDuckGo", "Available:")
 
+    @unittest.skipUnless(FULL_TESTS, LIVE_SKIP_REASON)
     async def test_web_search_tool(self):
         """Test web_search MCP tool."""
         result = await web_search(self.test_query, num_results=3, provider="auto")
@@ -131,41 +554,54 @@ class TestMCPTools(unittest.TestCase):
         self.assertIn(self.test_query, result)
 
         # Should include results or error message
-        self.assertTrue(
-            "Web Search Results" in result or
-            "No search results found" in result or
-            "Search failed" in result
-        )
+        self.assertTrue(any(s in result for s in _TOOL_SENTINELS))
 
+    @unittest.skipUnless(FULL_TESTS, LIVE_SKIP_REASON)
     async def test_research_topic_tool(self):
         """Test research_topic MCP tool."""
-        result = await research_topic("Python", depth="quick")
+        result = await cached_research("Python", depth="quick")
 
         self.assertIsInstance(result, str)
-        self.assertIn("Research Report", result)
-        self.assertIn("Python", result)
+        self.assert_all_in(result, "Research Report", "Python")
 
+    @unittest.skipUnless(FULL_TESTS, LIVE_SKIP_REASON)
     async def test_search_status_tool(self):
         """Test search_status MCP tool."""
         result = await search_status()
 
         self.assertIsInstance(result, str)
-        self.assertIn("Provider Status", result)
-        self.assertIn("DuckDuckGo", result)  # Should always be present
-        self.assertIn("Available:", result)
+        # DuckDuckGo should always be present
+        self.assert_all_in(result, "Provider Status", "DuckDuckGo", "Available:")
 
     async def test_research_depth_variations(self):
         """Test different research depths."""
-        for depth in ["quick", "standard", "deep"]:
-            result = await research_topic("blockchain", depth=depth)
-
-            self.assertIn("Research Report", result)
-            self.assertIn(f"Research Depth: {depth.title()}", result)
-
-
-class TestErrorHandling(unittest.TestCase):
+        depths = ["quick", "standard", "deep"]
+        canned = {
+            'query': "blockchain",
+            'results': [],
+            'providers_used': ["DuckDuckGo"],
+            'status': 'success'
+        }
+        with patch("web_search.WebSearchCoordinator.search_multi_provider",
+                   new=AsyncMock(return_value=canned)) as search:
+            results = await asyncio.gather(*(
+                research_topic("blockchain", depth=depth) for depth in depths
+            ))
+
+        # quick, standard and deep research issue 1, 3 and 5 queries
+        self.assertEqual(search.await_count, 9)
+        for depth, result in zip(depths, results):
+            self.assert_all_in(result, "Research Report",
+                               f"Research Depth: {depth.title()}")
+
+
+class TestErrorHandling(unittest.IsolatedAsyncioTestCase):
     """Test error handling and edge cases."""
 
+    async def asyncTearDown(self):
+        """Close the server coordinator's clients bound to this test's loop."""
+        await search_coordinator.aclose()
+
     async def test_empty_query_handling(self):
         """Test handling of empty queries."""
         result = await web_search("", num_results=5)
@@ -175,73 +611,62 @@ class TestErrorHandling(unittest.TestCase):
 
     async def test_network_error_resilience(self):
         """Test resilience to network errors."""
-        # This will test the actual error handling in providers
-        # Results may vary based on network conditions
-
         coordinator = WebSearchCoordinator()
-        result = await coordinator.search_multi_provider("test query", num_results=1)
+        coordinator.providers = [MockedDuckDuckGoProvider(unreachable_handler)]
+        try:
+            result = await coordinator.search_multi_provider("test query", num_results=1)
+        finally:
+            await coordinator.aclose()
 
         # Should return structured response even on errors
         self.assertIn('status', result)
+        self.assertEqual(result['status'], 'no_results')
+        self.assertEqual(result['providers_used'][0]['status'], 'error')
 
+    async def test_circuit_breaker_fails_fast(self):
+        """Test the test-harness breaker stops calling after repeated errors."""
+        breaker = CircuitBreaker(threshold=2)
+        calls = 0
 
-def run_async_test(coro):
-    """Helper to run async tests."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
-
-
-class AsyncTestCase(unittest.TestCase):
-    """Base class for async tests."""
+        async def failing_search():
+            nonlocal calls
+            calls += 1
+            return {'status': 'error', 'error': 'timeout'}
 
-    def run_async(self, coro):
-        """Run async coroutine in test."""
-        return run_async_test(coro)
+        open_result = {'status': 'error', 'error': 'circuit_open'}
+        for _ in range(4):
+            result = await breaker.call(failing_search, open_result)
 
+        self.assertEqual(calls, 2)
+        self.assertIs(result, open_result)
 
-# Make async tests work with unittest
-def make_async_test_methods():
-    """Convert async test methods to sync for unittest."""
-    test_classes = [TestWebSearchProviders,
-                    TestWebSearchCoordinator, TestMCPTools, TestErrorHandling]
+    async def test_circuit_breaker_single_trial_call(self):
+        """Test only one of several concurrent calls probes a half-open breaker."""
+        breaker = CircuitBreaker(threshold=1, reset_after=0)
+        calls = 0
+        status = 'error'
 
-    for test_class in test_classes:
-        for attr_name in dir(test_class):
-            attr = getattr(test_class, attr_name)
-            if (attr_name.startswith('test_') and
-                    asyncio.iscoroutinefunction(attr)):
+        async def slow_search():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {'status': status}
 
-                # Create sync wrapper
-                def make_sync_test(async_method):
-                    def sync_test(self):
-                        return run_async_test(async_method(self))
-                    return sync_test
+        open_result = {'status': 'error', 'error': 'circuit_open'}
+        # One failure trips it; reset_after=0 leaves it half-open straight away
+        await breaker.call(slow_search, open_result)
+        status = 'success'
 
-                # Replace async method with sync wrapper
-                sync_method = make_sync_test(attr)
-                sync_method.__name__ = attr_name
-                setattr(test_class, attr_name, sync_method)
+        results = await asyncio.gather(*(
+            breaker.call(slow_search, open_result) for _ in range(4)))
 
+        self.assertEqual(calls, 2)
+        self.assertEqual([r is open_result for r in results].count(False), 1)
 
-# Apply async test conversion
-make_async_test_methods()
+        # The successful trial closed the breaker again
+        await breaker.call(slow_search, open_result)
+        self.assertEqual(calls, 3)
 
 
 if __name__ == '__main__':
-    # Run tests
-    print("Running Web Research MCP Server Tests...")
-    print("=" * 50)
-
-    # Test with verbose output
-    unittest.main(verbosity=2, exit=False)
-
-    print("\n" + "=" * 50)
-    print("Web Search MCP Testing Complete!")
-<<<<<<< HEAD
-
-=======
->>>>>>> origin/main
+    unittest.main(verbosity=2)